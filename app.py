@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from math import atan2, cos, degrees, radians, sin
 from time import localtime, ticks_ms
 
@@ -12,12 +11,19 @@ from tildagonos import tildagonos
 import app
 
 from .common.gamma import gamma_corrections
-from .common.rgb_from_hue import rgb_from_degrees
 from .lib.background import Background
+from .lib.colour_field import ColourField
 from .lib.conf import conf
 from .lib.emf import EMF
+from .lib.frame import Frame
 from .lib.hand import Hand
+from .lib.hand_pose import HANDS, HandPose
+from .lib.pipeline import Pipeline
+from .lib.scheduler import Effect, Scheduler
 from .lib.shapes_list import shapes
+from .lib.sprites import Sprites, half_width
+
+shapes.add_polygons(conf.get("polygons", []))
 
 
 class Clock(app.App):
@@ -32,6 +38,7 @@ class Clock(app.App):
 
         # index in the `shapes` list
         self.shapes_index = 0
+        self.shape = shapes.select(self.shapes_index)
 
         # how much screen we use
         self.radius = 118
@@ -42,16 +49,19 @@ class Clock(app.App):
         self.colour_increment = 2
         self.rotate_colours_clockwise = True
         self.led_brightness = 0.5
+        self.colour_field = ColourField()
+        self.sprites = Sprites()
 
-        self.notifiers = {
-            "pulse": {"enabled": False, "timer": 0, "duration": 100},
-        }
+        self.scheduler = Scheduler()
+        self.scheduler.add("pulse", Effect(duration=200))
 
         # how much to rotate the clock face
         self.rotation_offset = 0
 
-        self.new_second = False
-        self.previous_seconds = 0
+        self.hand_pose = HandPose(
+            mode=conf.get("hand-mode", "tick"), overtick=conf["overtick-amount"]
+        )
+
         self.pulse_size = 2
         self.cardinal_point_bump = 4
 
@@ -59,11 +69,19 @@ class Clock(app.App):
 
         self.calculate_marker_offset()
 
+        # build frames on another thread while we draw, if `pipelined`
+        self.pipeline = Pipeline(
+            self.build,
+            [self.make_frame(), self.make_frame()],
+            threaded=conf.get("pipelined", False),
+        )
+        self.pipeline.start()
+
     def update(self, _):
         """Update."""
         self.scan_buttons()
 
-        self.update_notifiers()
+        self.scheduler.update(ticks_ms())
 
         # rotate the colours
         increment = (
@@ -86,8 +104,32 @@ class Clock(app.App):
 
     def draw(self, ctx):
         """Draw."""
-        self.overlays = []
+        frame = self.pipeline.next_frame()
+
+        self.light_leds(frame)
+
+        self.overlays = frame.overlays
+        self.draw_overlays(ctx)
 
+    def make_frame(self):
+        """Make a frame to build into."""
+        return Frame(
+            background=Background(colour=conf["background-colour"]),
+            brand=EMF(),
+            hands=[
+                Hand(
+                    filled=True,
+                    opacity=0.8,
+                    principal_length=conf["hands"][key]["length"],
+                    tail_length=conf["hands-overhang"],
+                    width=conf["hands"][key]["width"],
+                )
+                for key in HANDS
+            ],
+        )
+
+    def build(self, frame):
+        """Work out everything in `frame`."""
         self.hours, self.minutes, self.seconds = localtime()[3:6]
 
         # filthy DST hack
@@ -95,106 +137,64 @@ class Clock(app.App):
         if 4 <= month <= 10:
             self.hours = (self.hours + 1) % 24
 
-        self.overlays.append(Background(colour=conf["background-colour"]))
-
-        self.draw_brand()
+        # how much the pulse is swelling things, worked out once per frame
+        self.pulse = self.pulse_size * self.scheduler.level("pulse", ticks_ms())
 
-        self.draw_markers()
-        self.light_leds()
+        # everything takes its colour from here, by angle
+        self.colour_field.rotate(self.colour_offset)
 
-        rotations = OrderedDict(
-            {
-                "hour": ((self.hours * 3600) + (self.minutes * 60) + self.seconds)
-                / 120,
-                "minute": ((self.minutes * 60) + self.seconds) / 10,
-                "second": (self.seconds * 6) + self.overtick,
-            }
-        )
+        frame.set_shape(self.shape)
 
-        for key, rotation in rotations.items():
-            self.draw_hand(key, rotation)
+        self.build_brand(frame)
+        self.build_markers(frame)
+        self.build_leds(frame)
 
-        self.draw_overlays(ctx)
+        self.hand_pose.update(
+            self.hours, self.minutes, self.seconds, ticks_ms(), self.rotation_offset
+        )
+        for index in range(len(HANDS)):
+            self.build_hand(frame, index)
 
-    def update_notifiers(self):
-        """Update the `notifiers`."""
-        for notifier in self.notifiers.values():
-            if ticks_ms() - notifier["timer"] > notifier["duration"]:
-                notifier["enabled"] = False
-
-    def set_notifier(self, name):
-        """Set notifier `name`."""
-        self.notifiers[name]["enabled"] = True
-        self.notifiers[name]["timer"] = ticks_ms()
-
-    @property
-    def overtick(self):
-        """Calculate overtick."""
-        overtick = 0
-        if self.seconds != self.previous_seconds:
-            self.new_second = True
-            self.previous_seconds = self.seconds
-            overtick = conf["overtick-amount"]
-        self.new_second = False
-
-        return overtick
-
-    def draw_brand(self):
+    def build_brand(self, frame):
         """Write `EMF`."""
         centre = (
             -sin(radians(self.rotation_offset)) * conf["brand"]["y-offset"],
             -cos(radians(-self.rotation_offset)) * conf["brand"]["y-offset"],
         )
 
-        scale = conf["brand"]["scale"]
-        if self.notifiers["pulse"]["enabled"]:
-            scale += self.pulse_size
+        scale = conf["brand"]["scale"] + self.pulse
 
-        self.overlays.append(
-            EMF(
-                centre=centre,
-                colour=rgb_from_degrees(self.colour_offset),
-                rotation=-self.rotation_offset,
-                scale=scale,
-            )
+        frame.brand.pose(
+            centre,
+            radians(-self.rotation_offset),
+            scale,
+            self.colour_field.at(0),
         )
 
-    def draw_hand(self, key, rotation):
-        """Draw a hand."""
-        rotation = rotation - self.rotation_offset
+    def build_hand(self, frame, index):
+        """Point a hand."""
+        rotation = self.hand_pose.degrees[index]
 
-        colour = rgb_from_degrees(self.colour_offset % 360)
+        colour = self.colour_field.at(0)
         if conf["full-spectrum"]:
-            colour = rgb_from_degrees((180 - rotation + self.colour_offset) % 360)
-
-        self.overlays.append(
-            Hand(
-                colour=colour,
-                filled=True,
-                opacity=0.8,
-                principal_length=conf["hands"][key]["length"],
-                rotation=rotation,
-                tail_length=conf["hands-overhang"],
-                width=conf["hands"][key]["width"],
-            )
-        )
+            colour = self.colour_field.at(180 - rotation)
 
-    def draw_markers(self):
-        """Draw the number-ish bits."""
-        for angle in range(0, 360, 30):
+        frame.hands[index].pose(self.hand_pose.radians[index], colour)
+
+    def build_markers(self, frame):
+        """Place the number-ish bits."""
+        for index, marker in enumerate(frame.markers):
+            angle = index * 30
             rotation = angle + self.rotation_offset
             pair = (
                 sin(radians(rotation)) * self.marker_offset,
                 cos(radians(rotation)) * self.marker_offset,
             )
 
-            colour = rgb_from_degrees(self.colour_offset % 360)
-            if conf["full-spectrum"]:
-                colour = rgb_from_degrees((rotation + self.colour_offset) % 360)
+            hue_angle = rotation if conf["full-spectrum"] else 0
+            colour = self.colour_field.at(hue_angle)
 
-            size = conf["marker-size"]
-            if self.notifiers["pulse"]["enabled"]:
-                size += self.pulse_size
+            size = conf["marker-size"] + self.pulse
 
             if angle in [0, 90, 180, 270]:
                 pair = (
@@ -205,35 +205,41 @@ class Clock(app.App):
                 )
                 size += self.cardinal_point_bump
 
-            filled = conf["filled-markers"]
+            marker.pose(pair, radians(-rotation), size, colour)
+            marker.filled = conf["filled-markers"]
 
-            self.overlays.append(
-                shapes[self.shapes_index](
-                    centre=pair,
-                    colour=colour,
-                    filled=filled,
-                    rotation=-rotation,
-                    size=size,
+            # blit it if it's in the atlas, otherwise it's drawn as a path
+            marker.sprite = None
+            if conf.get("sprite-markers", False):
+                marker.sprite = self.sprites.find(
+                    self.shape, size, marker.filled, self.colour_field.hue(hue_angle)
                 )
-            )
-
-    def light_leds(self):
-        """Light the lights."""
-        for i in range(6):
-            tildagonos.leds[i + 13] = (0, 0, 0)
+                marker.sprite_half_width = half_width(size)
 
-        for i in range(12):
-            colour = rgb_from_degrees(self.colour_offset % 360)
+    def build_leds(self, frame):
+        """Work out the lights."""
+        for i, led in enumerate(frame.leds):
+            colour = self.colour_field.at(0)
             if conf["full-spectrum"]:
                 # 30 degrees per light
                 # 15 degree offset to be between the markers
                 # 180 offset because the goddamn screen is upside-down
-                colour = rgb_from_degrees(
-                    ((i * 30) + 15 + 180 + self.colour_offset) % 360
-                )
-            tildagonos.leds[12 - i] = [
-                gamma_corrections[int(c * 255 * self.led_brightness)] for c in colour
-            ]
+                colour = self.colour_field.at((i * 30) + 15 + 180)
+            for j, c in enumerate(colour):
+                led[j] = gamma_corrections[int(c * 255 * self.led_brightness)]
+
+    def light_leds(self, frame):
+        """Light the lights."""
+        for i in range(6):
+            tildagonos.leds[i + 13] = (0, 0, 0)
+
+        for i, led in enumerate(frame.leds):
+            tildagonos.leds[12 - i] = led
+
+    def minimise(self):
+        """Stop building frames while nobody's looking."""
+        self.pipeline.stop()
+        super().minimise()
 
     def calculate_marker_offset(self):
         """Recalculate when markers change size."""
@@ -250,6 +256,7 @@ class Clock(app.App):
     def increment_shapes_index(self):
         """Increment shapes-index."""
         self.shapes_index = (self.shapes_index + 1) % len(shapes)
+        self.shape = shapes.select(self.shapes_index)
 
     def grow_markers(self):
         """Make the markers bigger."""
@@ -276,7 +283,7 @@ class Clock(app.App):
             if self.button_states.get(BUTTON_TYPES[button]):
                 self.button_states.clear()
                 method()
-                self.set_notifier("pulse")
+                self.scheduler.start("pulse", ticks_ms())
 
 
 __app_export__ = Clock
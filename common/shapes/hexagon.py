@@ -1,18 +1,18 @@
 from math import sqrt
 
-from .shape import Shape
+from .polygon import Polygon
 
+HALF_ROOT_THREE = sqrt(3) / 2
 
-class Hexagon(Shape):
-    """A hexagon."""
 
-    def draw_lines(self, ctx):
-        """Draw ourself."""
-        ctx.move_to(0 - self.size, 0)
-        ctx.line_to((0 - self.size) / 2, (self.size * sqrt(3)) / 2)
-        ctx.line_to(self.size / 2, (self.size * sqrt(3)) / 2)
-        ctx.line_to(self.size, 0)
-        ctx.line_to(self.size / 2, (-self.size * sqrt(3)) / 2)
-        ctx.line_to((0 - self.size) / 2, (-self.size * sqrt(3)) / 2)
+class Hexagon(Polygon):
+    """A hexagon."""
 
-        ctx.close_path()
+    points = (
+        (-1, 0),
+        (-0.5, HALF_ROOT_THREE),
+        (0.5, HALF_ROOT_THREE),
+        (1, 0),
+        (0.5, -HALF_ROOT_THREE),
+        (-0.5, -HALF_ROOT_THREE),
+    )
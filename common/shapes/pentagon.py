@@ -1,15 +1,13 @@
-from .shape import Shape
+from .polygon import Polygon
 
 
-class Pentagon(Shape):
+class Pentagon(Polygon):
     """A pentagon."""
 
-    def draw_lines(self, ctx):
-        """Draw ourself."""
-        ctx.move_to(0, self.size)  # top
-        ctx.line_to(self.size * 0.8090, self.size * 0.4125)  # upper-right
-        ctx.line_to(self.size * 0.5, -self.size * 0.5388)  # lower-right
-        ctx.line_to(-self.size * 0.5, -self.size * 0.5388)  # lower-left
-        ctx.line_to(-self.size * 0.8090, self.size * 0.4125)  # upper-left
-
-        ctx.close_path()
+    points = (
+        (0, 1),  # top
+        (0.8090, 0.4125),  # upper-right
+        (0.5, -0.5388),  # lower-right
+        (-0.5, -0.5388),  # lower-left
+        (-0.8090, 0.4125),  # upper-left
+    )
@@ -0,0 +1,22 @@
+from .shape import Shape
+
+
+class Polygon(Shape):
+    """A polygon drawn from a list of unit-sized `points`."""
+
+    points = ()
+
+    def draw_lines(self, ctx):
+        """Draw ourself."""
+        x, y = self.points[0]
+        ctx.move_to(x * self.size, y * self.size)
+        for i in range(1, len(self.points)):
+            x, y = self.points[i]
+            ctx.line_to(x * self.size, y * self.size)
+
+        ctx.close_path()
+
+
+def polygon(name, points):
+    """Make a `Polygon` class called `name` from some `points`."""
+    return type(name, (Polygon,), {"points": [tuple(point) for point in points]})
@@ -20,6 +20,10 @@ class Shape:
         self.colour = list(colour) + [opacity]
         self.filled = filled
 
+        # a pre-rendered image to blit instead, if there is one
+        self.sprite = None
+        self.sprite_half_width = 0
+
     def position(self, ctx):
         """Get in position."""
         if self.__class__.__name__ not in ["Circle"]:
@@ -42,8 +46,20 @@ class Shape:
         else:
             ctx.stroke()
 
+    def blit(self, ctx):
+        """Draw our sprite."""
+        ctx.translate(*self.centre)
+        ctx.rotate(self.rotation)
+
+        half = self.sprite_half_width
+        ctx.image(self.sprite, -half, -half, half * 2, half * 2)
+
     def draw(self, ctx):
         """Actual drawing steps."""
+        if self.sprite:
+            self.blit(ctx)
+            return
+
         self.position(ctx)
         self.set_colour(ctx)
 
@@ -51,3 +67,10 @@ class Shape:
 
         self.close_shape(ctx)
         self.finalise(ctx)
+
+    def pose(self, centre, rotation, size, colour):
+        """Move to `centre` and `rotation` (in radians) at `size` in `colour`."""
+        self.centre = centre
+        self.rotation = rotation
+        self.size = size
+        self.colour[0:3] = colour
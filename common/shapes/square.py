@@ -1,14 +1,12 @@
-from .shape import Shape
+from .polygon import Polygon
 
 
-class Square(Shape):
+class Square(Polygon):
     """A square."""
 
-    def draw_lines(self, ctx):
-        """Draw ourself."""
-        ctx.move_to(self.size, -self.size)
-        ctx.line_to(self.size, self.size)
-        ctx.line_to(-self.size, self.size)
-        ctx.line_to(-self.size, -self.size)
-
-        ctx.close_path()
+    points = (
+        (1, -1),
+        (1, 1),
+        (-1, 1),
+        (-1, -1),
+    )
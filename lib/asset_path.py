@@ -1,12 +1,65 @@
 # https://tildagon.badge.emfcamp.org/tildagon-apps/reference/ctx/#adding-images
 import os
 
-apps = os.listdir("/apps")  # noqa: PTH208
-path = ""
-ASSET_PATH = "apps/"
+try:
+    # written by `scripts/pusher.py` when we deploy
+    from .install_path import INSTALL_PATH
+except ImportError:
+    INSTALL_PATH = None
 
-if "pikesley_tildagon_clock" in apps:
-    ASSET_PATH = "/apps/pikesley_tildagon_clock/"
 
-if "clock" in apps:
-    ASSET_PATH = "apps/clock/"
+class Assets:
+    """Find and load our files, only looking for them once."""
+
+    def __init__(self, root="/apps", install_path=INSTALL_PATH):
+        """Construct."""
+        self.root = root
+        self.install_path = install_path
+        self.asset_path = None
+
+        self.paths = {}
+        self.contents = {}
+
+    def find(self):
+        """Work out where we're installed, without listing every app."""
+        # `make push` installs as `clock`, the app store as the long name
+        candidates = [
+            self.install_path,
+            f"{self.root}/clock/",
+            f"{self.root}/pikesley_tildagon_clock/",
+        ]
+        for candidate in candidates:
+            if candidate and exists(candidate):
+                return candidate
+
+        return f"{self.root}/"
+
+    def path(self, name):
+        """Get the full path to asset `name`."""
+        if name not in self.paths:
+            if self.asset_path is None:
+                self.asset_path = self.find()
+            self.paths[name] = self.asset_path + name
+
+        return self.paths[name]
+
+    def read(self, name):
+        """Get the bytes of asset `name`."""
+        if name not in self.contents:
+            with open(self.path(name), "rb") as asset:  # noqa: PTH123
+                self.contents[name] = asset.read()
+
+        return self.contents[name]
+
+
+def exists(path):
+    """Check if `path` exists, with a single `stat`."""
+    try:
+        os.stat(path)  # noqa: PTH116
+    except OSError:
+        return False
+
+    return True
+
+
+assets = Assets()
@@ -1,4 +1,4 @@
-from ..lib.asset_path import ASSET_PATH
+from ..lib.asset_path import assets
 
 
 class Background:
@@ -11,10 +11,10 @@ class Background:
         opacity=0.6,
     ):
         """Construct."""
-        self.image = image
+        self.image = assets.path(image)
         self.colour = list(colour) + [opacity]
 
     def draw(self, ctx):
         """Draw ourself."""
-        ctx.image(ASSET_PATH + self.image, -120, -120, 240, 240)
+        ctx.image(self.image, -120, -120, 240, 240)
         ctx.rgba(*self.colour).rectangle(-120, -120, 240, 240).fill()
@@ -0,0 +1,26 @@
+from ..common.rgb_from_hue import rgb_from_degrees
+
+# the whole spectrum, one colour per degree, worked out once (as tuples, so
+# nobody can paint over them)
+SPECTRUM = [tuple(rgb_from_degrees(angle)) for angle in range(360)]
+
+
+class ColourField:
+    """The spectrum, rotated by the `colour_offset`."""
+
+    def __init__(self):
+        """Construct."""
+        self.offset = 0
+
+    def rotate(self, offset):
+        """Rotate the spectrum to `offset` degrees, once per frame."""
+        self.offset = int(offset)
+
+    def hue(self, angle):
+        """Get the hue, in whole degrees, at `angle` degrees around the face."""
+        # `round`, not `int`, so negative angles step the same as positive ones
+        return (round(angle) + self.offset) % 360
+
+    def at(self, angle):
+        """Get the colour at `angle` degrees around the face."""
+        return SPECTRUM[self.hue(angle)]
@@ -1,8 +1,6 @@
 import gzip
 import json
 
-from .asset_path import ASSET_PATH
+from .asset_path import assets
 
-conf = json.loads(
-    gzip.decompress(open(ASSET_PATH + "conf.json.gz", "rb").read()).decode()  # noqa: PTH123, SIM115
-)
+conf = json.loads(gzip.decompress(assets.read("conf.json.gz")).decode())
@@ -50,3 +50,10 @@ class EMF:
         ctx.line_to(3 * self.scale, 0)
 
         ctx.stroke()
+
+    def pose(self, centre, rotation, scale, colour):
+        """Move to `centre` and `rotation` (in radians) at `scale` in `colour`."""
+        self.centre = centre
+        self.rotation = rotation
+        self.scale = scale
+        self.colour[0:3] = colour
@@ -0,0 +1,30 @@
+MARKERS = 12
+LEDS = 12
+
+
+class Frame:
+    """Everything we need to draw one frame, worked out ahead of time."""
+
+    def __init__(self, background, brand, hands):
+        """Construct."""
+        self.background = background
+        self.brand = brand
+        self.hands = hands
+
+        # these get rebuilt if the marker shape changes
+        self.shape = None
+        self.markers = []
+
+        # RGB for each LED, already gamma-corrected
+        self.leds = [[0, 0, 0] for _ in range(LEDS)]
+
+        self.overlays = []
+
+    def set_shape(self, shape):
+        """Make sure our markers are `shape`s."""
+        if shape is self.shape:
+            return
+
+        self.shape = shape
+        self.markers = [shape() for _ in range(MARKERS)]
+        self.overlays = [self.background, self.brand] + self.markers + self.hands
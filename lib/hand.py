@@ -41,3 +41,8 @@ class Hand:
             ctx.fill()
         else:
             ctx.stroke()
+
+    def pose(self, rotation, colour):
+        """Point at `rotation` (in radians) in `colour`."""
+        self.rotation = rotation
+        self.colour[0:3] = colour
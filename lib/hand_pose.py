@@ -0,0 +1,75 @@
+from math import radians
+
+from .ticks import ticks_diff
+
+HANDS = ("hour", "minute", "second")
+MODES = ("tick", "sweep")
+
+# degrees per second for each hand
+RATES = (1 / 120, 1 / 10, 6)
+RADIAN_RATES = tuple(radians(rate) for rate in RATES)
+
+# the 60 second (or minute) positions around the face
+SIXTY = [radians(step * 6) for step in range(60)]
+
+
+class HandPose:
+    """Where the hands are pointing."""
+
+    def __init__(self, mode="tick", overtick=0):
+        """Construct."""
+        # `tick` jumps once a second, `sweep` moves smoothly
+        if mode not in MODES:
+            message = f"`hand-mode` must be one of {MODES}, not `{mode}`"
+            raise ValueError(message)
+        self.mode = mode
+        self.overtick = overtick
+        self.radian_overtick = radians(overtick)
+
+        # hour, minute, second: degrees for the colours, radians for the drawing
+        self.degrees = [0.0, 0.0, 0.0]
+        self.radians = [0.0, 0.0, 0.0]
+
+        # the same but as at the top of this second, without the tilt
+        self.second_degrees = [0.0, 0.0, 0.0]
+        self.second_radians = [0.0, 0.0, 0.0]
+
+        self.previous_seconds = None
+        self.second_started = 0
+
+    def update(self, hours, minutes, seconds, now, rotation_offset=0):
+        """Move the hands, `now` is in milliseconds."""
+        new_second = seconds != self.previous_seconds
+        if new_second:
+            self.previous_seconds = seconds
+            self.second_started = now
+            self.cache(hours, minutes, seconds)
+
+        fraction = 0
+        if self.mode == "sweep":
+            fraction = min(ticks_diff(now, self.second_started), 999) / 1000
+
+        radian_offset = radians(rotation_offset)
+        for i in range(3):
+            self.degrees[i] = (
+                self.second_degrees[i] + (RATES[i] * fraction) - rotation_offset
+            )
+            self.radians[i] = (
+                self.second_radians[i] + (RADIAN_RATES[i] * fraction) - radian_offset
+            )
+
+        if new_second and self.mode == "tick":
+            self.degrees[2] += self.overtick
+            self.radians[2] += self.radian_overtick
+
+    def cache(self, hours, minutes, seconds):
+        """Work out the angles for this second."""
+        self.second_degrees[0] = ((hours * 3600) + (minutes * 60) + seconds) / 120
+        self.second_degrees[1] = ((minutes * 60) + seconds) / 10
+        self.second_degrees[2] = seconds * 6
+
+        self.second_radians[0] = (
+            SIXTY[(hours % 12) * 5] + (SIXTY[minutes] / 12) + (SIXTY[seconds] / 720)
+        )
+        self.second_radians[1] = SIXTY[minutes] + (SIXTY[seconds] / 60)
+        self.second_radians[2] = SIXTY[seconds]
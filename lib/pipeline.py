@@ -0,0 +1,113 @@
+try:
+    from threading import Lock, Thread
+
+    def start_thread(function):
+        """Run `function` in the background, on the host."""
+        Thread(target=function, daemon=True).start()
+
+except ImportError:
+    from _thread import allocate_lock as Lock  # noqa: N812
+    from _thread import start_new_thread
+
+    def start_thread(function):
+        """Run `function` in the background, on the badge."""
+        start_new_thread(function, ())
+
+
+class Pipeline:
+    """Build the next frame while the current one is being drawn."""
+
+    def __init__(self, build, frames, threaded=False):  # noqa: FBT002
+        """Construct."""
+        # `build(frame)` fills in a frame
+        self.build = build
+        self.frames = frames
+        self.threaded = threaded
+
+        # we draw `frames[front]` while `frames[back]` gets built
+        self.front = 0
+        self.back = 1
+
+        # two locks, made once and used as semaphores: the builder waits on
+        # `back_free` before building, and releases `back_ready` when it's
+        # done; the drawer waits on `back_ready`, swaps, and releases
+        # `back_free`
+        self.back_free = Lock()
+        self.back_ready = Lock()
+        self.back_ready.acquire()
+
+        # `running` asks the builder to keep going, `producing` says it is
+        self.running = False
+        self.producing = False
+
+        # anything the builder raised, to be raised again when we draw
+        self.error = None
+
+    def start(self):
+        """Build the first frame, and start the builder if we're threaded."""
+        self.build(self.frames[self.front])
+        self.resume()
+
+    def resume(self):
+        """Start the builder, unless it's still going (or has failed)."""
+        if not self.threaded or self.error:
+            return
+
+        self.running = True
+        if not self.producing:
+            self.producing = True
+            start_thread(self.produce)
+
+    def stop(self):
+        """Stop the builder, once it's finished the frame it's on.
+
+        A builder that's waiting for a swap just stays asleep, and carries on
+        if we `resume` before it notices.
+        """
+        self.running = False
+
+    def produce(self):
+        """Keep a frame built and ready."""
+        try:
+            while True:
+                # sleeps here, without polling, until the drawer swaps
+                self.back_free.acquire()
+                if not self.running:
+                    self.back_free.release()
+                    break
+
+                self.build(self.frames[self.back])
+                self.back_ready.release()
+
+        except Exception as error:  # noqa: BLE001
+            self.error = error
+            self.running = False
+            self.back_free.release()
+
+            # wake the drawer so it can raise it
+            self.back_ready.release()
+
+        finally:
+            self.producing = False
+
+    def next_frame(self):
+        """Get the frame to draw."""
+        if not self.threaded:
+            self.build(self.frames[self.front])
+            return self.frames[self.front]
+
+        # we were stopped (say, minimised), so start building again
+        if not (self.running and self.producing):
+            self.resume()
+
+        self.back_ready.acquire()
+
+        if self.error:
+            error, self.error = self.error, None
+            raise error
+
+        # swap before we free `back`, so the builder sees the new one
+        self.front, self.back = self.back, self.front
+        self.back_free.release()
+
+        return self.frames[self.front]
@@ -0,0 +1,101 @@
+from heapq import heappop, heappush
+from math import pi, sin
+
+from .ticks import ticks_add, ticks_diff
+
+
+class Effect:
+    """Something that happens for a while, like a pulse."""
+
+    def __init__(self, duration, on_start=None, on_end=None):
+        """Construct."""
+        # in milliseconds
+        self.duration = duration
+        self.on_start = on_start
+        self.on_end = on_end
+
+        self.enabled = False
+        self.started = 0
+        self.deadline = 0
+
+    def progress(self, now):
+        """How far through we are, from 0.0 to 1.0."""
+        if not self.enabled:
+            return 0.0
+
+        if self.duration <= 0:
+            return 1.0
+
+        return min(max(ticks_diff(now, self.started), 0) / self.duration, 1.0)
+
+    def level(self, now):
+        """Ease in and back out again, from 0.0 up to 1.0 and back down."""
+        return sin(pi * self.progress(now))
+
+
+class Scheduler:
+    """Run `Effect`s, keeping their deadlines in a heap."""
+
+    def __init__(self):
+        """Construct."""
+        self.effects = {}
+        self.deadlines = []
+        self.sequence = 0
+
+        # our own never-wrapping milliseconds, to keep the heap in order
+        # across a `ticks_ms` wrap
+        self.elapsed = 0
+        self.last_ticks = None
+
+    def add(self, name, effect):
+        """Add an `effect`."""
+        self.effects[name] = effect
+        return effect
+
+    def start(self, name, now):
+        """Start (or restart) effect `name`."""
+        effect = self.effects[name]
+        effect.enabled = True
+        effect.started = now
+        effect.deadline = ticks_add(now, effect.duration)
+
+        if self.last_ticks is not None:
+            self.elapsed += ticks_diff(now, self.last_ticks)
+        self.last_ticks = now
+
+        # the sequence number stops us ever comparing names
+        self.sequence += 1
+        heappush(
+            self.deadlines,
+            (self.elapsed + effect.duration, self.sequence, name, effect.deadline),
+        )
+
+        if effect.on_start:
+            effect.on_start()
+
+    def due(self, now):
+        """Check if anything has run out."""
+        return bool(self.deadlines) and ticks_diff(self.deadlines[0][3], now) <= 0
+
+    def update(self, now):
+        """End anything that's run out."""
+        while self.due(now):
+            _, _, name, deadline = heappop(self.deadlines)
+            effect = self.effects[name]
+
+            # restarting an effect leaves its old deadline behind
+            if not effect.enabled or effect.deadline != deadline:
+                continue
+
+            effect.enabled = False
+
+            if effect.on_end:
+                effect.on_end()
+
+    def active(self, name):
+        """Check if effect `name` is running."""
+        return self.effects[name].enabled
+
+    def level(self, name, now):
+        """Get the eased level of effect `name`."""
+        return self.effects[name].level(now)
@@ -1,15 +1,107 @@
-from ..common.shapes.circle import Circle
-from ..common.shapes.hexagon import Hexagon
-from ..common.shapes.pentagon import Pentagon
-from ..common.shapes.pentagram import Pentagram
-from ..common.shapes.square import Square
-from ..common.shapes.triangle import Triangle
-
-shapes = [
-    Hexagon,
-    Pentagon,
-    Pentagram,
-    Square,
-    Triangle,
-    Circle,
-]
+import gc
+import sys
+
+from ..common.shapes.polygon import polygon
+
+# the package we're installed as, e.g. `apps.clock`
+PACKAGE = __name__.rsplit(".", 2)[0]
+
+# drop the shapes we're not using if we have less than this much memory left
+LOW_MEMORY = 16 * 1024
+
+
+class ShapesList:
+    """The marker shapes, only imported when they're first needed."""
+
+    def __init__(self, entries):
+        """Construct."""
+        # `(module, class)` names, or ready-made classes
+        self.entries = list(entries)
+        self.loaded = {}
+
+    def __len__(self):
+        """How many shapes we have."""
+        return len(self.entries)
+
+    def __getitem__(self, index):
+        """Get the shape class at `index`, importing it if we must."""
+        if index not in self.loaded:
+            entry = self.entries[index]
+            if isinstance(entry, tuple):
+                module_name, class_name = entry
+                module = __import__(
+                    f"{PACKAGE}.common.shapes.{module_name}", None, None, [class_name]
+                )
+                entry = getattr(module, class_name)
+
+            self.loaded[index] = entry
+
+        return self.loaded[index]
+
+    def select(self, index):
+        """Get the shape at `index`, shedding the others if memory is tight."""
+        if low_on_memory():
+            self.evict(keep=index)
+
+        return self[index]
+
+    def evict(self, keep=None):
+        """Forget every loaded shape except `keep`."""
+        for index in list(self.loaded):
+            if index == keep:
+                continue
+
+            del self.loaded[index]
+            entry = self.entries[index]
+            if isinstance(entry, tuple):
+                sys.modules.pop(f"{PACKAGE}.common.shapes.{entry[0]}", None)
+
+                # importing it also hung it on `common.shapes`
+                parent = sys.modules.get(f"{PACKAGE}.common.shapes")
+                if parent and hasattr(parent, entry[0]):
+                    delattr(parent, entry[0])
+
+        gc.collect()
+
+    def add_polygons(self, definitions):
+        """Add some data-driven polygons, like the ones in `conf.yaml`."""
+        for definition in definitions:
+            name = definition.get("name", "Polygon")
+            points = definition.get("points")
+            if not valid_points(points):
+                message = f"polygon `{name}` needs at least 3 [x, y] points"
+                raise ValueError(message)
+
+            self.entries.append(polygon(name, points))
+
+
+def valid_points(points):
+    """Check `points` is at least 3 `[x, y]` pairs."""
+    if not isinstance(points, (list, tuple)) or len(points) < 3:
+        return False
+
+    return all(
+        isinstance(point, (list, tuple))
+        and len(point) == 2
+        and all(isinstance(value, (int, float)) for value in point)
+        for point in points
+    )
+
+
+def low_on_memory():
+    """Check if we're running out of memory."""
+    # `mem_free` only exists on the badge
+    mem_free = getattr(gc, "mem_free", None)
+    return mem_free is not None and mem_free() < LOW_MEMORY
+
+
+shapes = ShapesList(
+    [
+        ("hexagon", "Hexagon"),
+        ("pentagon", "Pentagon"),
+        ("pentagram", "Pentagram"),
+        ("square", "Square"),
+        ("triangle", "Triangle"),
+        ("circle", "Circle"),
+    ]
+)
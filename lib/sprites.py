@@ -0,0 +1,47 @@
+from .asset_path import assets
+
+# what `scripts/build_sprites.py` renders: every built-in shape, at the sizes
+# the markers are with the default `marker-size` (plain and cardinal), filled
+# and not, in one hue every `HUE_STEP` degrees
+SHAPES = ("Circle", "Hexagon", "Pentagon", "Pentagram", "Square", "Triangle")
+SIZES = (10, 14)
+HUE_STEP = 30
+HUES = 360 // HUE_STEP
+
+# same as the vector markers
+OPACITY = 0.7
+
+
+def half_width(size):
+    """Get half the width of a sprite of `size`, leaving room for the stroke."""
+    return size + 2
+
+
+def sprite_name(shape_name, size, filled, hue):
+    """Get the file name of a sprite."""
+    fill = "filled" if filled else "outline"
+    return f"sprites/{shape_name.lower()}-{size}-{fill}-{hue:03d}.png"
+
+
+class Sprites:
+    """Pre-rendered markers, to blit instead of drawing paths."""
+
+    def __init__(self):
+        """Construct."""
+        # sprite paths, by `(shape name, size, filled)`, one per hue step
+        self.paths = {}
+
+    def find(self, shape, size, filled, hue):
+        """Get the sprite for a marker, or `None` if it has to be drawn."""
+        # in-between sizes (like mid-pulse) and conf polygons aren't rendered
+        if size not in SIZES or shape.__name__ not in SHAPES:
+            return None
+
+        key = (shape.__name__, int(size), filled)
+        if key not in self.paths:
+            self.paths[key] = [
+                assets.path(sprite_name(key[0], key[1], filled, step * HUE_STEP))
+                for step in range(HUES)
+            ]
+
+        return self.paths[key][round(hue / HUE_STEP) % HUES]
@@ -0,0 +1,15 @@
+# `ticks_ms` wraps around, so sums on it have to go through these
+try:
+    from time import ticks_add, ticks_diff
+except ImportError:
+    # on the host, wrap the same way the badge does
+    TICKS_PERIOD = 2**30
+
+    def ticks_add(ticks, delta):
+        """Add `delta` milliseconds to `ticks`."""
+        return (ticks + delta) % TICKS_PERIOD
+
+    def ticks_diff(end, start):
+        """Get the signed milliseconds from `start` to `end`."""
+        half = TICKS_PERIOD // 2
+        return ((end - start + half) % TICKS_PERIOD) - half
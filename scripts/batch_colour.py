@@ -0,0 +1,22 @@
+"""`rgb_from_degrees` with NumPy, for benchmarking and testing on the host."""
+
+import numpy as np
+
+
+def batch_rgb_from_degrees(angles, segments):
+    """Do `rgb_from_degrees` for a whole array of `angles` at once."""
+    angles = np.asarray(angles, dtype=float) % 360
+    sectors = np.floor(angles / 60).astype(int)
+
+    offsets = (angles - (sectors * 60)) / 60
+    offsets = np.where(sectors % 2 == 1, 1 - offsets, offsets)
+
+    # fixed component values for each sector, `nan` where it follows the offset
+    fixed = np.array(
+        [
+            [segment.get(component, np.nan) for component in ["red", "green", "blue"]]
+            for segment in segments
+        ]
+    )[sectors]
+
+    return np.where(np.isnan(fixed), offsets[:, np.newaxis], fixed)
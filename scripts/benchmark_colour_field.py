@@ -0,0 +1,50 @@
+from timeit import timeit
+
+from host import load
+
+rgb_from_hue = load("common.rgb_from_hue")
+colour_field = load("lib.colour_field")
+
+FRAMES = 2000
+
+# 12 markers, 12 LEDs, 3 hands
+ANGLES = list(range(0, 360, 30)) + [(i * 30) + 195 for i in range(12)] + [10, 90, 270]
+
+
+def scalar(offset):
+    """Work out every colour from scratch."""
+    for angle in ANGLES:
+        rgb_from_hue.rgb_from_degrees((angle + offset) % 360)
+
+
+field = colour_field.ColourField()
+
+
+def lookup(offset):
+    """Rotate the field and look the colours up."""
+    field.rotate(offset)
+    for angle in ANGLES:
+        field.at(angle)
+
+
+if __name__ == "__main__":
+    runs = [("scalar", scalar), ("field", lookup)]
+    try:
+        from batch_colour import batch_rgb_from_degrees
+
+        def batched(offset):
+            """Work out every colour in one go with NumPy."""
+            batch_rgb_from_degrees(
+                [angle + offset for angle in ANGLES], rgb_from_hue.segments
+            )
+
+        runs.append(("numpy", batched))
+    except ImportError:
+        print("no NumPy, skipping the batched version")
+
+    for name, function in runs:
+        elapsed = timeit(
+            lambda function=function: [function(i % 360) for i in range(FRAMES)],
+            number=1,
+        )
+        print(f"{name:>7}: {elapsed / FRAMES * 1e6:.1f} us/frame")
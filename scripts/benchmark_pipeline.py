@@ -0,0 +1,41 @@
+from time import perf_counter
+
+from host import Anything, load, load_clock
+
+FRAMES = 500
+
+
+def measure(clock_class, conf, threaded):
+    """Get the draws and the new frames per second."""
+    conf["pipelined"] = threaded
+    clock = clock_class()
+
+    built = [0]
+    build = clock.pipeline.build
+
+    def counted_build(frame):
+        """Count the frames built."""
+        built[0] += 1
+        build(frame)
+
+    clock.pipeline.build = counted_build
+
+    ctx = Anything()
+    start = perf_counter()
+    for _ in range(FRAMES):
+        clock.update(0)
+        clock.draw(ctx)
+    elapsed = perf_counter() - start
+
+    clock.pipeline.stop()
+    return FRAMES / elapsed, built[0] / elapsed
+
+
+if __name__ == "__main__":
+    clock_class = load_clock()
+    conf = load("lib.conf").conf
+
+    for threaded in [False, True]:
+        mode = "pipelined" if threaded else "serial"
+        draws, built = measure(clock_class, conf, threaded)
+        print(f"{mode:>10}: {draws:.1f} draws/sec, {built:.1f} new frames/sec")
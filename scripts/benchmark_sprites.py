@@ -0,0 +1,44 @@
+from collections import Counter
+
+from host import load, load_clock
+
+FRAMES = 100
+
+
+class Counting:
+    """A fake `ctx` which counts the calls made on it."""
+
+    def __init__(self):
+        """Construct."""
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        """Count any call."""
+        return lambda *_args: self.calls.update([name]) or self
+
+
+def measure(clock_class, conf, sprites):
+    """Get the `ctx` calls per frame, by name."""
+    conf["sprite-markers"] = sprites
+    clock = clock_class()
+    ctx = Counting()
+
+    for _ in range(FRAMES):
+        clock.update(0)
+        clock.draw(ctx)
+
+    clock.pipeline.stop()
+    return {name: count / FRAMES for name, count in ctx.calls.items()}
+
+
+if __name__ == "__main__":
+    clock_class = load_clock()
+    conf = load("lib.conf").conf
+
+    for sprites in [False, True]:
+        mode = "sprites" if sprites else "paths"
+        calls = measure(clock_class, conf, sprites)
+        print(
+            f"{mode:>7}: {sum(calls.values()):.0f} ctx calls/frame, "
+            f"{calls.get('line_to', 0):.0f} line_to, {calls.get('image', 0):.0f} image"
+        )
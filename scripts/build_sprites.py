@@ -0,0 +1,65 @@
+from pathlib import Path
+
+from host import ROOT, load
+from PIL import Image, ImageDraw
+
+sprites = load("lib.sprites")
+SPECTRUM = load("lib.colour_field").SPECTRUM
+
+# draw big and shrink, for smooth edges
+SUPERSAMPLE = 4
+
+# ctx's default line width, which the vector markers are stroked with
+LINE_WIDTH = 2
+
+
+def shape_class(name):
+    """Get the built-in shape class `name`."""
+    return getattr(load(f"common.shapes.{name.lower()}"), name)
+
+
+def render(shape, size, filled, hue):
+    """Draw one sprite."""
+    half = sprites.half_width(size)
+    scale = SUPERSAMPLE
+    image = Image.new("RGBA", (half * 2 * scale, half * 2 * scale), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+
+    colour = tuple(round(c * 255) for c in SPECTRUM[hue]) + (
+        round(sprites.OPACITY * 255),
+    )
+    fill = colour if filled else None
+    width = LINE_WIDTH * scale
+
+    if shape.__name__ == "Circle":
+        box = [(half - size) * scale, (half - size) * scale]
+        box += [(half + size) * scale, (half + size) * scale]
+        draw.ellipse(box, fill=fill, outline=colour, width=width)
+    else:
+        points = [
+            ((half + x * size) * scale, (half + y * size) * scale)
+            for x, y in shape.points
+        ]
+        draw.polygon(points, fill=fill, outline=colour, width=width)
+
+    return image.resize((half * 2, half * 2), Image.Resampling.LANCZOS)
+
+
+def build():
+    """Render the whole atlas into `sprites/`."""
+    Path(ROOT, "sprites").mkdir(exist_ok=True)
+
+    for name in sprites.SHAPES:
+        shape = shape_class(name)
+        for size in sprites.SIZES:
+            for filled in [True, False]:
+                for step in range(sprites.HUES):
+                    hue = step * sprites.HUE_STEP
+                    render(shape, size, filled, hue).save(
+                        Path(ROOT, sprites.sprite_name(name, size, filled, hue)),
+                        optimize=True,
+                    )
+
+
+if __name__ == "__main__":
+    build()
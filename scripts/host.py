@@ -0,0 +1,102 @@
+"""Load the app on the host, for the benchmarks and the tests."""
+
+import sys
+import time
+import types
+from importlib import import_module
+from pathlib import Path
+
+# on the badge we're `apps.<something>`, so we fake-up a package to live in
+PACKAGE = "clock"
+ROOT = Path(__file__).parent.parent
+
+
+class Anything:
+    """Accept any call or attribute, and do nothing."""
+
+    def __getattr__(self, _):
+        """Get ourself."""
+        return self
+
+    def __call__(self, *_args, **_kwargs):
+        """Do nothing, and get ourself."""
+        return self
+
+    def __getitem__(self, _key):
+        """Get ourself."""
+        return self
+
+    def __setitem__(self, _key, _value):
+        """Forget `value`."""
+
+
+class App:
+    """Stand-in for the badge's `app.App`."""
+
+    def draw_overlays(self, ctx):
+        """Draw everything in `overlays`."""
+        for overlay in self.overlays:
+            overlay.draw(ctx)
+
+    def minimise(self):
+        """Do nothing."""
+
+
+class Buttons:
+    """Stand-in for `events.input.Buttons`, with nothing ever pressed."""
+
+    def __init__(self, _app):
+        """Construct."""
+
+    def get(self, _button):
+        """Nothing's pressed."""
+        return False
+
+
+def stub(name, **attributes):
+    """Make a fake module `name`."""
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+
+
+def stub_badge():
+    """Fake-up the badge's own modules."""
+    stub("app", App=App)
+    stub("imu", acc_read=lambda: (0.0, 0.0, 9.8))
+    stub("ntptime", settime=lambda: None)
+    stub("events")
+    stub("events.input", BUTTON_TYPES=Anything(), Buttons=Buttons)
+    stub("system")
+    stub("system.eventbus", eventbus=Anything())
+    stub("system.patterndisplay")
+    stub("system.patterndisplay.events", PatternDisable=Anything())
+    stub("tildagonos", tildagonos=Anything())
+
+    # `time.ticks_ms` only exists on the badge
+    time.ticks_ms = lambda: int(time.perf_counter() * 1000) % (2**30)
+
+
+def forget_package():
+    """Unload the package and everything in it."""
+    for name in list(sys.modules):
+        if name == PACKAGE or name.startswith(f"{PACKAGE}."):
+            del sys.modules[name]
+
+
+def load(name):
+    """Import `name` from the app, e.g. `lib.colour_field`."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(ROOT)]
+        sys.modules[PACKAGE] = package
+
+    return import_module(f"{PACKAGE}.{name}")
+
+
+def load_clock():
+    """Get the `Clock` class, with its assets read from this checkout."""
+    stub_badge()
+    load("lib.asset_path").assets.asset_path = f"{ROOT}/"
+
+    return load("app").Clock
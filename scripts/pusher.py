@@ -69,8 +69,16 @@ class PushManager:
         """Assemble commands."""
         self.cp_file_commands = [cp_file(entry, self.app) for entry in self.files]
 
+    def write_install_path(self):
+        """Record where we're going, so the app doesn't have to look."""
+        Path(self.app_root, "lib", "install_path.py").write_text(
+            f'INSTALL_PATH = "/apps/{self.app}/"\n', encoding="utf-8"
+        )
+
     def push(self):
         """Push."""
+        self.write_install_path()
+
         commands = self.mkdir_commands + self.cp_dir_commands + self.cp_file_commands
         for command in commands:
             print(command)
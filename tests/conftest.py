@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# for the host-only helpers
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from host import PACKAGE, forget_package
+from host import load as load_module
+
+
+@pytest.fixture
+def package():
+    """Load the app as a package, fresh for each test."""
+    forget_package()
+
+    yield PACKAGE
+
+    forget_package()
+
+
+@pytest.fixture
+def load(package):  # noqa: ARG001
+    """Get a function which imports `name` from the package."""
+    return load_module
+
+
+def loaded(prefix):
+    """List the loaded modules under `prefix`."""
+    return sorted(name for name in sys.modules if name.startswith(prefix))
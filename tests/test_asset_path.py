@@ -0,0 +1,88 @@
+import os
+
+import pytest
+from pusher import PushManager
+
+
+@pytest.fixture
+def apps(tmp_path):
+    """Make a fake `/apps` full of other people's apps."""
+    root = tmp_path / "apps"
+    for app in ["snake", "clock", "tetris"]:
+        (root / app).mkdir(parents=True)
+
+    (root / "clock" / "conf.json.gz").write_bytes(b"conf")
+    return root
+
+
+@pytest.fixture(autouse=True)
+def no_scanning(monkeypatch):
+    """Fail if anything lists a directory."""
+    monkeypatch.setattr(os, "listdir", pytest.fail)
+
+
+def test_no_scan_at_import(load, apps):
+    """Test importing, or finding ourselves, never lists `/apps`."""
+    asset_path = load("lib.asset_path")
+    assets = asset_path.Assets(root=str(apps))
+
+    assert assets.path("emf.png") == f"{apps}/clock/emf.png"
+
+
+def test_install_path(load, apps):
+    """Test a recorded install path is used."""
+    asset_path = load("lib.asset_path")
+    (apps / "mine").mkdir()
+    assets = asset_path.Assets(root=str(apps), install_path=f"{apps}/mine/")
+
+    assert assets.path("emf.png") == f"{apps}/mine/emf.png"
+
+
+def test_stale_install_path(load, apps):
+    """Test we check the usual names if the recorded path has gone away."""
+    asset_path = load("lib.asset_path")
+    assets = asset_path.Assets(root=str(apps), install_path=f"{apps}/gone/")
+
+    assert assets.path("emf.png") == f"{apps}/clock/emf.png"
+
+
+def test_app_store_name(load, tmp_path):
+    """Test we find ourselves when installed from the app store."""
+    asset_path = load("lib.asset_path")
+    (tmp_path / "apps" / "pikesley_tildagon_clock").mkdir(parents=True)
+    assets = asset_path.Assets(root=str(tmp_path / "apps"))
+
+    assert assets.path("emf.png") == f"{tmp_path}/apps/pikesley_tildagon_clock/emf.png"
+
+
+def test_nowhere(load, tmp_path):
+    """Test we fall back to `/apps` itself."""
+    asset_path = load("lib.asset_path")
+    (tmp_path / "apps").mkdir()
+    assets = asset_path.Assets(root=str(tmp_path / "apps"))
+
+    assert assets.path("emf.png") == f"{tmp_path}/apps/emf.png"
+
+
+def test_read_once(load, apps):
+    """Test assets are only read once."""
+    asset_path = load("lib.asset_path")
+    assets = asset_path.Assets(root=str(apps))
+
+    assert assets.read("conf.json.gz") == b"conf"
+
+    (apps / "clock" / "conf.json.gz").unlink()
+
+    assert assets.read("conf.json.gz") == b"conf"
+
+
+def test_pusher_records_install_path(tmp_path):
+    """Test deploying writes the install path."""
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "includes").write_text("lib\n")
+
+    PushManager("clock", app_root=tmp_path).write_install_path()
+
+    assert (tmp_path / "lib" / "install_path.py").read_text() == (
+        'INSTALL_PATH = "/apps/clock/"\n'
+    )
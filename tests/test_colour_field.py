@@ -0,0 +1,53 @@
+import pytest
+
+
+def test_whole_degrees(load):
+    """Test the field matches the scalar colours exactly on whole degrees."""
+    colour_field = load("lib.colour_field")
+    rgb_from_degrees = load("common.rgb_from_hue").rgb_from_degrees
+    field = colour_field.ColourField()
+    for offset in range(0, 360, 7):
+        field.rotate(offset)
+        for angle in range(-180, 540, 13):
+            assert field.at(angle) == tuple(rgb_from_degrees((angle + offset) % 360))
+
+
+def test_fractional_degrees(load):
+    """Test the field is within half a degree of the scalar colours."""
+    colour_field = load("lib.colour_field")
+    rgb_from_degrees = load("common.rgb_from_hue").rgb_from_degrees
+    field = colour_field.ColourField()
+    field.rotate(42)
+    for angle in [0.4, 29.9, 123.25, 359.99, -10.4, -10.7, -0.8, 0.8]:
+        expected = rgb_from_degrees((angle + 42) % 360)
+        assert field.at(angle) == pytest.approx(expected, abs=0.5 / 60)
+
+
+def test_no_recomputation(load):
+    """Test rotating hands out the same precomputed colours."""
+    colour_field = load("lib.colour_field")
+    field = colour_field.ColourField()
+    field.rotate(100)
+
+    assert field.at(20) is colour_field.SPECTRUM[120]
+
+
+def test_colours_are_read_only(load):
+    """Test nobody can paint over the shared spectrum."""
+    field = load("lib.colour_field").ColourField()
+
+    with pytest.raises(TypeError):
+        field.at(0)[0] = 0.5
+
+
+def test_numpy_batch(load):
+    """Test the batched colours match the scalar ones."""
+    rgb_from_hue = load("common.rgb_from_hue")
+    np = pytest.importorskip("numpy")
+    batch_colour = pytest.importorskip("batch_colour")
+
+    angles = np.linspace(-360, 720, 1081)
+    batch = batch_colour.batch_rgb_from_degrees(angles, rgb_from_hue.segments)
+
+    for angle, colour in zip(angles, batch, strict=True):
+        assert list(colour) == pytest.approx(rgb_from_hue.rgb_from_degrees(angle % 360))
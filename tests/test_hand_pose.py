@@ -0,0 +1,68 @@
+from math import isclose, radians
+
+import pytest
+
+
+def test_tick(load):
+    """Test the ticking hands match the old sums."""
+    hand_pose = load("lib.hand_pose")
+    pose = hand_pose.HandPose(overtick=1.5)
+    pose.update(13, 25, 40, 1000, rotation_offset=10)
+    pose.update(13, 25, 40, 1500, rotation_offset=10)
+
+    expected = [
+        ((13 * 3600) + (25 * 60) + 40) / 120 - 10,
+        ((25 * 60) + 40) / 10 - 10,
+        (40 * 6) - 10,
+    ]
+    for i in range(3):
+        assert isclose(pose.degrees[i], expected[i])
+        assert isclose(
+            pose.radians[i] % radians(360), radians(expected[i]) % radians(360)
+        )
+
+
+def test_overtick(load):
+    """Test the second hand bounces on a new second."""
+    hand_pose = load("lib.hand_pose")
+    pose = hand_pose.HandPose(overtick=1.5)
+    pose.update(1, 2, 3, 0)
+
+    assert pose.degrees[2] == 19.5
+
+    pose.update(1, 2, 3, 100)
+
+    assert pose.degrees[2] == 18
+
+
+def test_sweep(load):
+    """Test the sweeping hands move between seconds."""
+    hand_pose = load("lib.hand_pose")
+    pose = hand_pose.HandPose(mode="sweep", overtick=1.5)
+    pose.update(0, 0, 10, 5000)
+    pose.update(0, 0, 10, 5500)
+
+    assert isclose(pose.degrees[2], 63)
+    assert isclose(pose.degrees[1], 1.05)
+    assert isclose(pose.radians[2], radians(63))
+
+
+def test_no_new_lists(load):
+    """Test we reuse the same lists every frame."""
+    hand_pose = load("lib.hand_pose")
+    pose = hand_pose.HandPose()
+    degrees, radians_ = pose.degrees, pose.radians
+
+    pose.update(1, 2, 3, 0)
+    pose.update(1, 2, 4, 1000)
+
+    assert pose.degrees is degrees
+    assert pose.radians is radians_
+
+
+def test_unknown_mode(load):
+    """Test a typo in `hand-mode` is caught."""
+    hand_pose = load("lib.hand_pose")
+
+    with pytest.raises(ValueError, match="`swept`"):
+        hand_pose.HandPose(mode="swept")
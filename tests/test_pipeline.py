@@ -0,0 +1,110 @@
+from time import sleep
+
+import pytest
+
+
+class Counter:
+    """A frame-builder which numbers its frames."""
+
+    def __init__(self):
+        """Construct."""
+        self.count = 0
+        self.building = None
+
+    def build(self, frame):
+        """Give `frame` the next number."""
+        self.building = frame
+        sleep(0.0001)
+        self.count += 1
+        frame["number"] = self.count
+        self.building = None
+
+
+def test_serial(load):
+    """Test we build every frame as it's asked for."""
+    pipeline = load("lib.pipeline")
+    counter = Counter()
+    line = pipeline.Pipeline(counter.build, [{}, {}])
+    line.start()
+
+    assert line.next_frame()["number"] == 2
+    assert line.next_frame()["number"] == 3
+    assert line.next_frame() is line.frames[0]
+
+
+def test_threaded(load):
+    """Test every frame is new, in order, and never one that's being built."""
+    pipeline = load("lib.pipeline")
+    counter = Counter()
+    line = pipeline.Pipeline(counter.build, [{}, {}], threaded=True)
+    line.start()
+
+    numbers = []
+    for _ in range(200):
+        frame = line.next_frame()
+        assert frame is not counter.building
+        numbers.append(frame["number"])
+        sleep(0.0001)
+
+    line.stop()
+
+    assert numbers == list(range(2, 202))
+
+
+def wait_for(condition):
+    """Wait up to a second for `condition()`."""
+    for _ in range(1000):
+        if condition():
+            return True
+        sleep(0.001)
+
+    return False
+
+
+def test_stop_and_resume(load):
+    """Test the builder stops while nobody draws, and carries on when they do."""
+    pipeline = load("lib.pipeline")
+    counter = Counter()
+    line = pipeline.Pipeline(counter.build, [{}, {}], threaded=True)
+    line.start()
+    line.next_frame()
+
+    line.stop()
+    sleep(0.05)
+    count = counter.count
+    sleep(0.05)
+
+    assert counter.count == count
+
+    number = line.next_frame()["number"]
+
+    assert number >= count
+    assert line.running
+    assert line.next_frame()["number"] == number + 1
+
+    line.stop()
+
+
+def test_builder_error(load):
+    """Test a builder error turns up when we draw."""
+    pipeline = load("lib.pipeline")
+    frames = []
+
+    def build(frame):
+        """Fail on the second frame."""
+        frames.append(frame)
+        if len(frames) > 1:
+            message = "bad polygon"
+            raise ValueError(message)
+
+    line = pipeline.Pipeline(build, [{}, {}], threaded=True)
+    line.start()
+
+    assert wait_for(lambda: line.error)
+    assert wait_for(lambda: not line.producing)
+    with pytest.raises(ValueError, match="bad polygon"):
+        line.next_frame()
+
+    # the next draw starts a new builder, which fails the same way
+    with pytest.raises(ValueError, match="bad polygon"):
+        line.next_frame()
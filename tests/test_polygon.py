@@ -0,0 +1,26 @@
+from math import sqrt
+
+import pytest
+
+
+class Recorder:
+    """A fake `ctx` which remembers where it was sent."""
+
+    def __init__(self):
+        """Construct."""
+        self.calls = []
+
+    def __getattr__(self, name):
+        """Record any call."""
+        return lambda *args: self.calls.append((name, *args)) or self
+
+
+def test_hexagon_vertices(load):
+    """Test the hexagon is where it always was."""
+    shapes = load("lib.shapes_list").shapes
+    ctx = Recorder()
+    shapes[0](size=10).draw_lines(ctx)
+
+    assert ctx.calls[0] == ("move_to", -10, 0)
+    assert ctx.calls[1] == ("line_to", -5, pytest.approx(10 * sqrt(3) / 2))
+    assert ctx.calls[-1] == ("close_path",)
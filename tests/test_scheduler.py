@@ -0,0 +1,107 @@
+import pytest
+
+
+def test_nothing_due(load):
+    """Test an empty scheduler."""
+    scheduler = load("lib.scheduler")
+    clock = scheduler.Scheduler()
+
+    assert not clock.due(1000)
+
+
+def test_expiry(load):
+    """Test an effect runs out."""
+    scheduler = load("lib.scheduler")
+    ended = []
+    clock = scheduler.Scheduler()
+    clock.add("pulse", scheduler.Effect(100, on_end=lambda: ended.append(True)))
+
+    clock.start("pulse", 1000)
+    clock.update(1099)
+
+    assert clock.active("pulse")
+    assert not ended
+
+    clock.update(1100)
+
+    assert not clock.active("pulse")
+    assert ended == [True]
+
+
+def test_restart(load):
+    """Test restarting pushes the deadline back."""
+    scheduler = load("lib.scheduler")
+    clock = scheduler.Scheduler()
+    clock.add("pulse", scheduler.Effect(100))
+
+    clock.start("pulse", 1000)
+    clock.start("pulse", 1050)
+    clock.update(1100)
+
+    assert clock.active("pulse")
+
+    clock.update(1150)
+
+    assert not clock.active("pulse")
+    assert not clock.deadlines
+
+
+def test_deadline_order(load):
+    """Test effects end in deadline order."""
+    scheduler = load("lib.scheduler")
+    ended = []
+    clock = scheduler.Scheduler()
+    for name, duration in [("chime", 300), ("pulse", 100), ("flash", 200)]:
+        clock.add(
+            name,
+            scheduler.Effect(duration, on_end=lambda name=name: ended.append(name)),
+        )
+        clock.start(name, 0)
+
+    clock.update(250)
+
+    assert ended == ["pulse", "flash"]
+
+
+def test_level(load):
+    """Test the level eases in and out."""
+    scheduler = load("lib.scheduler")
+    effect = scheduler.Effect(100)
+    effect.enabled = True
+
+    assert effect.level(0) == 0
+    assert effect.level(50) == 1
+    assert effect.level(25) == pytest.approx(effect.level(75))
+
+
+def test_ticks_wrap(load):
+    """Test effects end in order when `ticks_ms` wraps round."""
+    scheduler = load("lib.scheduler")
+    period = load("lib.ticks").TICKS_PERIOD
+    clock = scheduler.Scheduler()
+    clock.add("chime", scheduler.Effect(200))
+    clock.add("pulse", scheduler.Effect(150))
+
+    # the chime ends just before the wrap, the pulse just after
+    clock.start("chime", period - 250)
+    clock.start("pulse", period - 100)
+
+    assert clock.effects["pulse"].progress(20) == 0.8
+
+    clock.update(period - 50)
+
+    assert not clock.active("chime")
+    assert clock.active("pulse")
+
+    clock.update(50)
+
+    assert not clock.active("pulse")
+
+
+def test_zero_duration(load):
+    """Test an instant effect doesn't divide by zero."""
+    scheduler = load("lib.scheduler")
+    effect = scheduler.Effect(0)
+    effect.enabled = True
+
+    assert effect.progress(0) == 1.0
@@ -0,0 +1,67 @@
+import sys
+import weakref
+
+import pytest
+from conftest import loaded
+
+SHAPES = "clock.common.shapes."
+
+
+def test_nothing_imported_at_startup(load):
+    """Test no concrete shapes are loaded at import."""
+    load("lib.shapes_list")
+
+    assert loaded(SHAPES) == [f"{SHAPES}polygon", f"{SHAPES}shape"]
+
+
+def test_import_on_first_selection(load):
+    """Test a shape is imported when it's selected."""
+    shapes = load("lib.shapes_list").shapes
+
+    shape = shapes.select(2)
+
+    assert shape.__name__ == "Pentagram"
+    assert f"{SHAPES}pentagram" in loaded(SHAPES)
+    assert f"{SHAPES}hexagon" not in loaded(SHAPES)
+    assert shapes.select(2) is shape
+
+
+def test_evict(load):
+    """Test unused shapes can be dropped."""
+    shapes = load("lib.shapes_list").shapes
+    for index in range(len(shapes)):
+        shapes.select(index)
+    hexagon = weakref.ref(sys.modules[f"{SHAPES}hexagon"])
+
+    shapes.evict(keep=3)
+
+    assert hexagon() is None
+
+    assert list(shapes.loaded) == [3]
+    assert loaded(SHAPES) == [
+        f"{SHAPES}polygon",
+        f"{SHAPES}shape",
+        f"{SHAPES}square",
+    ]
+
+
+def test_add_polygons(load):
+    """Test data-driven polygons."""
+    shapes = load("lib.shapes_list").shapes
+
+    shapes.add_polygons([{"name": "diamond", "points": [[0, -1], [1, 0], [0, 1]]}])
+
+    assert len(shapes) == 7
+    assert shapes[6].__name__ == "diamond"
+    assert shapes[6].points == [(0, -1), (1, 0), (0, 1)]
+
+
+@pytest.mark.parametrize(
+    "points", [None, [], [[0, 1], [1, 0]], [[0, 1], [1, 0], [1]], [[0, 1], "a", [1, 1]]]
+)
+def test_bad_polygons(load, points):
+    """Test broken polygons are caught at startup."""
+    shapes = load("lib.shapes_list").shapes
+
+    with pytest.raises(ValueError, match="`wonky` needs at least 3"):
+        shapes.add_polygons([{"name": "wonky", "points": points}])
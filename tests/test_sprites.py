@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import pytest
+from host import ROOT
+from test_polygon import Recorder
+
+
+@pytest.fixture
+def sprites(load):
+    """Get the sprites module."""
+    return load("lib.sprites")
+
+
+def test_atlas_sizes(load, sprites):
+    """Test markers at atlas sizes get a sprite."""
+    shapes = load("lib.shapes_list").shapes
+
+    path = sprites.Sprites().find(shapes[0], 10, filled=False, hue=0)
+
+    assert path.endswith("sprites/hexagon-10-outline-000.png")
+
+
+@pytest.mark.parametrize("size", [11.5, 12])
+def test_other_sizes(load, sprites, size):
+    """Test markers at any other size are drawn."""
+    shapes = load("lib.shapes_list").shapes
+
+    assert sprites.Sprites().find(shapes[0], size, filled=False, hue=0) is None
+
+
+def test_conf_polygons(load, sprites):
+    """Test our own polygons are drawn."""
+    shapes = load("lib.shapes_list").shapes
+    shapes.add_polygons([{"name": "Diamond", "points": [[0, -1], [1, 0], [0, 1]]}])
+
+    assert sprites.Sprites().find(shapes[6], 10, filled=False, hue=0) is None
+
+
+@pytest.mark.parametrize(
+    ("hue", "step"), [(0, "000"), (14, "000"), (16, "030"), (200, "210"), (350, "000")]
+)
+def test_hue_steps(load, sprites, hue, step):
+    """Test hues snap to the nearest rendered one."""
+    shapes = load("lib.shapes_list").shapes
+
+    path = sprites.Sprites().find(shapes[3], 14, filled=True, hue=hue)
+
+    assert path.endswith(f"sprites/square-14-filled-{step}.png")
+
+
+def test_atlas_is_complete(sprites):
+    """Test every sprite we might ask for has been rendered."""
+    for name in sprites.SHAPES:
+        for size in sprites.SIZES:
+            for filled in [True, False]:
+                for step in range(sprites.HUES):
+                    hue = step * sprites.HUE_STEP
+                    assert Path(
+                        ROOT, sprites.sprite_name(name, size, filled, hue)
+                    ).is_file()
+
+
+def test_blit(load):
+    """Test a marker with a sprite blits it instead of drawing a path."""
+    shapes = load("lib.shapes_list").shapes
+    marker = shapes[0]()
+    marker.pose((3, 4), 0.5, 10, (1, 0, 0))
+    marker.sprite = "sprites/hexagon-10-outline-000.png"
+    marker.sprite_half_width = 12
+
+    ctx = Recorder()
+    marker.draw(ctx)
+
+    assert ctx.calls == [
+        ("translate", 3, 4),
+        ("rotate", 0.5),
+        ("image", "sprites/hexagon-10-outline-000.png", -12, -12, 24, 24),
+    ]